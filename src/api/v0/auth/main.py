@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from slowapi import Limiter
 
+from src.core import auth_cache
 from src.core.security import new_sk, new_rk, hash_key, verify_key, new_branch_master_key, hash_master_key
 from src.core.rate_limit import get_real_client_ip
 from src.core.db.tables.recoverykey import RecoveryKey
@@ -195,6 +196,8 @@ def refresh_token(
         sk_object.sk_id = new_sk_id
         sk_object.sk_hash = new_sk_hash
         session.commit()
+        # Drop the rotated key from the in-memory lookup cache
+        auth_cache.invalidate(sk_id)
         logger.info(f"Secret key refreshed successfully for user: {sk_object.username}")
     except IntegrityError:
         session.rollback()
@@ -6,6 +6,10 @@ import bleach
 MAX_PAGE_LIMIT = 1000
 DEFAULT_PAGE_LIMIT = 100
 
+# Compiled once into the model's core schema when the class is built;
+# per-request validation runs the precompiled regex in pydantic-core
+BRANCH_NAME_PATTERN = r'^[a-zA-Z0-9_-]+$'
+
 
 class PaginationParams(BaseModel):
     """Pagination parameters with enforced limits."""
@@ -15,7 +19,7 @@ class PaginationParams(BaseModel):
 
 class BranchCreate(BaseModel):
     """Request schema for creating a branch"""
-    name: str = Field(..., min_length=3, max_length=256, pattern=r'^[a-zA-Z0-9_-]+$')
+    name: str = Field(..., min_length=3, max_length=256, pattern=BRANCH_NAME_PATTERN)
     description: str | None = Field(None, max_length=4096)
     
     @field_validator('description')
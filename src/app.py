@@ -4,20 +4,22 @@ Main FastAPI application with frontend serving
 """
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import Depends, FastAPI, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import Session, load_only
 
 from src.api.router import router as api_router
 from src.api.rss import router as rss_router
+from src.core.auth_cache import lookup_secret_key
+from src.core.db.engine import init_schema
 from src.core.db.session import get_db
 from src.core.db.tables.branch import Branch
-from src.core.db.tables.secretkey import SecretKey
 from src.core.db.tables.userpost import UserPost
 from src.core.logger import configure_app_logging, get_logger
 from src.core.middleware import (
@@ -25,6 +27,7 @@ from src.core.middleware import (
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
 )
+from src.core.static_cache import CachedStaticFiles
 
 # Configure application logging
 configure_app_logging(log_to_file=True)
@@ -35,9 +38,16 @@ logger = get_logger(__name__)
 # Base directory for templates and static files
 BASE_DIR = Path(__file__).resolve().parent
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the database schema on startup (first worker only)."""
+    init_schema()
+    yield
+
+
 # Create app with production settings
 DEBUG = os.getenv("OPENX_DEBUG", "false").lower() == "true"
-app = FastAPI(title="OpenX", debug=DEBUG)
+app = FastAPI(title="OpenX", debug=DEBUG, lifespan=lifespan)
 
 # Add security middleware
 app.add_middleware(SecurityHeadersMiddleware)
@@ -46,13 +56,24 @@ app.add_middleware(RequestLoggingMiddleware)
 
 logger.info("OpenX application initialized")
 
-# Mount static files
+# Mount static files (served from an in-memory cache with far-future headers)
 app.mount(
-    "/static", StaticFiles(directory=BASE_DIR / "frontend" / "static"), name="static"
+    "/static",
+    CachedStaticFiles(directory=BASE_DIR / "frontend" / "static"),
+    name="static",
 )
 
-# Templates
-templates = Jinja2Templates(directory=BASE_DIR / "frontend" / "templates")
+# Templates, with compiled bytecode cached on disk so template parsing is
+# paid once per deploy instead of once per worker process
+JINJA_CACHE_DIR = Path(".data") / "jinja_cache"
+JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(BASE_DIR / "frontend" / "templates"),
+        autoescape=select_autoescape(("html", "htm", "xml")),
+        bytecode_cache=FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR)),
+    )
+)
 
 # Include API routes
 app.include_router(api_router)
@@ -60,6 +81,59 @@ app.include_router(api_router)
 # Include RSS routes (at root level, not under /api)
 app.include_router(rss_router)
 
+# Only the columns the list templates actually render; the rest (timestamps,
+# video metadata, formatting) stay deferred and are hydrated on the detail page
+POST_LIST_COLUMNS = load_only(
+    UserPost.type,
+    UserPost.username,
+    UserPost.branch,
+    UserPost.content,
+    UserPost.image_url,
+    UserPost.alt_text,
+    UserPost.video_url,
+)
+
+
+def parse_before_cursor(before: str | None) -> int | None:
+    """
+    Parse a keyset pagination cursor: the id of the last post on the
+    previous page (ids are already exposed in the post links).
+
+    Returns None for the first page; malformed cursors are ignored.
+    """
+    if not before:
+        return None
+    try:
+        return int(before)
+    except ValueError:
+        return None
+
+
+def paginate_posts(stmt, before_id: int | None):
+    """
+    Apply keyset pagination and feed ordering to a post list statement.
+
+    Posts are listed newest-first by id (insertion order), so a page is
+    just 'the 50 largest ids below the cursor' - O(log N) per page where
+    OFFSET degrades linearly with page depth.
+    """
+    if before_id is not None:
+        stmt += lambda s: s.where(UserPost.id < before_id)
+    stmt += (
+        lambda s: s.order_by(UserPost.id.desc())
+        .limit(50)
+        .execution_options(yield_per=25)
+    )
+    return stmt
+
+
+def get_popular_branches(session: Session) -> list[Branch]:
+    """Fetch the active branches shown in the sidebar."""
+    stmt = lambda_stmt(
+        lambda: select(Branch).where(Branch.deleted_at.is_(None)).limit(10)
+    )
+    return session.scalars(stmt).all()
+
 
 def get_current_user_optional(
     request: Request, session: Session = Depends(get_db)
@@ -69,17 +143,18 @@ def get_current_user_optional(
     if not sk:
         return None
 
-    # Look up user by secret key (first 16 chars as ID)
+    # Look up user by secret key (first 16 chars as ID), cached in memory
     sk_id = sk[:16] if len(sk) >= 16 else sk
-    user = session.execute(select(SecretKey).where(SecretKey.sk_id == sk_id)).scalar()
+    user = lookup_secret_key(session, sk_id)
 
     if user:
-        # Verify the full key hash
-        from src.core.security import verify_key
+        sk_hash, username = user
+        # Verify the full key hash (cached after first verification)
+        from src.core.security import verify_key_for_id
 
-        if verify_key(sk, user.sk_hash):
-            logger.debug(f"User authenticated: {user.username}")
-            return {"username": user.username, "sk": sk}
+        if verify_key_for_id(sk_id, sk, sk_hash):
+            logger.debug(f"User authenticated: {username}")
+            return {"username": username, "sk": sk}
     return None
 
 
@@ -87,6 +162,7 @@ def get_current_user_optional(
 @app.get("/", response_class=HTMLResponse)
 async def feed_page(
     request: Request,
+    before: str | None = None,
     session: Session = Depends(get_db),
     user: dict | None = Depends(get_current_user_optional),
 ):
@@ -95,24 +171,17 @@ async def feed_page(
         f"Feed page accessed by user: {user['username'] if user else 'anonymous'}"
     )
 
-    # Get posts from all branches, ordered by most recent
-    posts = (
-        session.execute(
-            select(UserPost)
-            .where(UserPost.branch.isnot(None))
-            .order_by(desc(UserPost.id))
-            .limit(50)
-        )
-        .scalars()
-        .all()
+    # Get posts from all branches, ordered by most recent.
+    # Streamed in batches of 25; the template consumes the iterator lazily.
+    stmt = lambda_stmt(
+        lambda: select(UserPost)
+        .options(POST_LIST_COLUMNS)
+        .where(UserPost.branch.isnot(None))
     )
+    posts = session.scalars(paginate_posts(stmt, parse_before_cursor(before)))
 
     # Get popular branches for sidebar
-    branches = (
-        session.execute(select(Branch).where(Branch.deleted_at.is_(None)).limit(10))
-        .scalars()
-        .all()
-    )
+    branches = get_popular_branches(session)
 
     return templates.TemplateResponse(
         request,
@@ -125,6 +194,7 @@ async def feed_page(
 async def branch_page(
     request: Request,
     branch_name: str,
+    before: str | None = None,
     session: Session = Depends(get_db),
     user: dict | None = Depends(get_current_user_optional),
 ):
@@ -132,32 +202,28 @@ async def branch_page(
     logger.info(f"Branch page accessed: /b/{branch_name}")
 
     # Get branch info
-    branch = session.execute(
-        select(Branch).where(Branch.name == branch_name, Branch.deleted_at.is_(None))
-    ).scalar()
+    branch = session.scalar(
+        lambda_stmt(
+            lambda: select(Branch).where(
+                Branch.name == branch_name, Branch.deleted_at.is_(None)
+            )
+        )
+    )
 
     if not branch:
         logger.warning(f"Branch not found: {branch_name}")
         raise HTTPException(status_code=404, detail="Branch not found")
 
-    # Get posts from this branch
-    posts = (
-        session.execute(
-            select(UserPost)
-            .where(UserPost.branch == branch_name)
-            .order_by(desc(UserPost.id))
-            .limit(50)
-        )
-        .scalars()
-        .all()
+    # Get posts from this branch, streamed in batches of 25
+    stmt = lambda_stmt(
+        lambda: select(UserPost)
+        .options(POST_LIST_COLUMNS)
+        .where(UserPost.branch == branch_name)
     )
+    posts = session.scalars(paginate_posts(stmt, parse_before_cursor(before)))
 
     # Get popular branches for sidebar
-    branches = (
-        session.execute(select(Branch).where(Branch.deleted_at.is_(None)).limit(10))
-        .scalars()
-        .all()
-    )
+    branches = get_popular_branches(session)
 
     return templates.TemplateResponse(
         request,
@@ -176,28 +242,21 @@ async def branch_page(
 async def user_page(
     request: Request,
     username: str,
+    before: str | None = None,
     session: Session = Depends(get_db),
     user: dict | None = Depends(get_current_user_optional),
 ):
     """User profile page"""
-    # Get user's posts (both profile and branch posts)
-    posts = (
-        session.execute(
-            select(UserPost)
-            .where(UserPost.username == username)
-            .order_by(desc(UserPost.id))
-            .limit(50)
-        )
-        .scalars()
-        .all()
+    # Get user's posts (both profile and branch posts), streamed in batches
+    stmt = lambda_stmt(
+        lambda: select(UserPost)
+        .options(POST_LIST_COLUMNS)
+        .where(UserPost.username == username)
     )
+    posts = session.scalars(paginate_posts(stmt, parse_before_cursor(before)))
 
     # Get popular branches for sidebar
-    branches = (
-        session.execute(select(Branch).where(Branch.deleted_at.is_(None)).limit(10))
-        .scalars()
-        .all()
-    )
+    branches = get_popular_branches(session)
 
     return templates.TemplateResponse(
         request,
@@ -259,13 +318,9 @@ async def submit_page(
         branch = f"u_{user['username']}"
 
     # Get branches for dropdown
-    branches = (
-        session.execute(
-            select(Branch).where(Branch.deleted_at.is_(None)).order_by(Branch.name)
-        )
-        .scalars()
-        .all()
-    )
+    branches = session.scalars(
+        select(Branch).where(Branch.deleted_at.is_(None)).order_by(Branch.name)
+    ).all()
 
     return templates.TemplateResponse(
         request,
@@ -302,17 +357,15 @@ async def post_detail_page(
 ):
     """Post detail page with comments"""
     # Get post
-    post = session.execute(select(UserPost).where(UserPost.id == post_id)).scalar()
+    post = session.scalar(
+        lambda_stmt(lambda: select(UserPost).where(UserPost.id == post_id))
+    )
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
     # Get popular branches for sidebar
-    branches = (
-        session.execute(select(Branch).where(Branch.deleted_at.is_(None)).limit(10))
-        .scalars()
-        .all()
-    )
+    branches = get_popular_branches(session)
 
     return templates.TemplateResponse(
         request,
@@ -0,0 +1,81 @@
+"""
+In-memory cache for secret key lookups.
+
+Every page render resolves the `secret_key` cookie to a `SecretKey` row via
+a SELECT on `sk_id`. The active-user set is small and hot, so the
+`sk_id -> (sk_hash, username)` mapping is cached in memory with a TTL,
+eliminating the round-trip on repeat requests.
+
+Entries must be invalidated on key rotation (see /api/auth/recovery).
+"""
+import threading
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.db.tables.secretkey import SecretKey
+
+# Cache configuration
+CACHE_MAXSIZE = 10_000
+CACHE_TTL = 600  # seconds
+
+# sk_id -> (expiry timestamp, (sk_hash, username))
+_cache: dict[str, tuple[float, tuple[str, str]]] = {}
+_lock = threading.RLock()
+
+
+def lookup_secret_key(session: Session, sk_id: str) -> tuple[str, str] | None:
+    """
+    Resolve an sk_id to (sk_hash, username), using the cache when possible.
+
+    On a cache miss the SELECT is executed against the given session and the
+    result is cached for CACHE_TTL seconds. Returns None for unknown sk_ids
+    (negative results are not cached).
+
+    Args:
+        session: Database session to use on a cache miss
+        sk_id: Key identifier (first 16 chars of the secret key)
+
+    Returns:
+        Tuple of (sk_hash, username), or None if the key is unknown
+    """
+    now = time.monotonic()
+
+    with _lock:
+        entry = _cache.get(sk_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    sk_object = session.execute(
+        select(SecretKey).where(SecretKey.sk_id == sk_id)
+    ).scalar()
+
+    if sk_object is None:
+        return None
+
+    value = (sk_object.sk_hash, sk_object.username)
+
+    with _lock:
+        if len(_cache) >= CACHE_MAXSIZE:
+            # Evict expired entries first; if the cache is still full it is
+            # dominated by live keys, so start over rather than scan for LRU
+            for key in [k for k, (expiry, _) in _cache.items() if expiry <= now]:
+                del _cache[key]
+            if len(_cache) >= CACHE_MAXSIZE:
+                _cache.clear()
+        _cache[sk_id] = (now + CACHE_TTL, value)
+
+    return value
+
+
+def invalidate(sk_id: str) -> None:
+    """Drop a cached entry. Must be called when a key is rotated or revoked."""
+    with _lock:
+        _cache.pop(sk_id, None)
+
+
+def clear() -> None:
+    """Drop all cached entries."""
+    with _lock:
+        _cache.clear()
@@ -1,3 +1,4 @@
+import fcntl
 import os
 from pathlib import Path
 from sqlalchemy import create_engine
@@ -10,16 +11,18 @@ data_dir.mkdir(exist_ok=True)
 
 # Configure engine with connection pooling
 # For SQLite, pool settings are mostly ignored but good practice for production DBs
+# SQL echo logs every statement and parameter list - pure overhead on the hot
+# path, so it stays off unless explicitly requested for debugging
 engine = create_engine(
     database_url,
-    echo=False,
+    echo=os.getenv("OPENX_SQL_ECHO", "false").lower() == "true",
     pool_size=10,
     max_overflow=20,
     pool_pre_ping=True,
     pool_recycle=3600,
 )
 
-# Create all tables on import
+# Import all tables so Base.metadata knows the full schema
 from src.core.db.tables.base import Base
 from src.core.db.tables.secretkey import SecretKey
 from src.core.db.tables.recoverykey import RecoveryKey
@@ -29,4 +32,54 @@ from src.core.db.tables.media import Media
 from src.core.db.tables.moderation_log import ModerationLog
 from src.core.db.tables.comment import Comment
 
-Base.metadata.create_all(engine)
\ No newline at end of file
+# Sentinel recording which schema create_all last ran for in this data
+# directory, so sibling workers can skip the scan at the same startup
+_schema_sentinel = data_dir / ".schema_ok"
+_schema_lock = data_dir / ".schema_lock"
+
+
+def _schema_fingerprint() -> str:
+    """Sorted table names; changes whenever a table is added or renamed."""
+    return "\n".join(sorted(Base.metadata.tables))
+
+
+def _sentinel_valid() -> bool:
+    """
+    Whether the sentinel can be trusted to skip create_all.
+
+    It cannot if the SQLite file it describes has been deleted, or if the
+    declared schema no longer matches the one recorded when it was written
+    (e.g. a release added a table).
+    """
+    if database_url.startswith("sqlite:///"):
+        db_path = Path(database_url.removeprefix("sqlite:///"))
+        if not db_path.exists():
+            return False
+    try:
+        return _schema_sentinel.read_text() == _schema_fingerprint()
+    except OSError:
+        return False
+
+
+def init_schema() -> None:
+    """
+    Create all tables if they don't exist yet.
+
+    Called from the application lifespan handler instead of at import time,
+    so importing the engine stays cheap. Under `uvicorn --workers N` each
+    worker runs this; an flock-serialized filesystem sentinel ensures only
+    the first worker pays for the create_all scan. The sentinel is ignored
+    when the database file is missing or the declared schema has changed,
+    so deleting openx.db or shipping a new table re-runs create_all.
+    """
+    if _sentinel_valid():
+        return
+
+    with open(_schema_lock, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if not _sentinel_valid():
+                Base.metadata.create_all(engine)
+                _schema_sentinel.write_text(_schema_fingerprint())
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
\ No newline at end of file
@@ -4,7 +4,7 @@ from fastapi import Depends, HTTPException, status, Request
 from typing import Generator
 from sqlalchemy.orm import sessionmaker, Session
 from src.core.db.engine import engine
-from src.core.security import verify_key
+from src.core.security import verify_key_for_id
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 def get_db() -> Generator[Session, None, None]:
@@ -39,8 +39,8 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid secret key"
         )
 
-    # Verify the full key against the hash
-    if not verify_key(secret_key, sk_object.sk_hash):
+    # Verify the full key against the hash (cached after first verification)
+    if not verify_key_for_id(sk_id, secret_key, sk_object.sk_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid secret key"
         )
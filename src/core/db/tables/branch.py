@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -8,9 +8,16 @@ from src.core.db.tables.base import Base
 
 class Branch(Base):
     """Branch (subreddit) table"""
-    
+
     __tablename__ = "branch"
 
+    # Partial index over active branches only. Every sidebar/lookup query
+    # filters deleted_at IS NULL, so name probes and the ORDER BY name
+    # dropdown query run entirely inside this index.
+    __table_args__ = (
+        Index("ix_branch_active", "name", sqlite_where=text("deleted_at IS NULL")),
+    )
+
     name: Mapped[str] = mapped_column(String(256), primary_key=True, unique=True)
     description: Mapped[str | None] = mapped_column(String(4096), nullable=True)
     master_key: Mapped[str] = mapped_column(String(256))
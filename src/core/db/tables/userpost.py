@@ -10,6 +10,11 @@ class UserPost(Base):
 
     __tablename__ = "user_post"
 
+    # List views paginate by id (the rowid), so the branch index below plus
+    # the implicit rowid order cover the feed scans; no composite index
+    # needed. A covering index isn't worth it either: the views load content
+    # and media columns too, so every insert would pay to duplicate most of
+    # the row while reads still couldn't skip the table lookup.
     type: Mapped[str] = mapped_column(String(50))
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, unique=True)
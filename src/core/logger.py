@@ -1,10 +1,12 @@
 """
 Centralized logging configuration for OpenX application
 """
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
@@ -15,6 +17,30 @@ DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Default log directory
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 
+# One RotatingFileHandler per log file, shared by every logger targeting it.
+# Separate handlers on the same file each hold their own fd and lock, so
+# concurrent writes serialize on locks that aren't actually exclusive and
+# rotation can corrupt the file.
+_FILE_HANDLERS: dict[Path, RotatingFileHandler] = {}
+
+
+def _get_file_handler(
+    file_path: Path,
+    max_bytes: int,
+    backup_count: int,
+) -> RotatingFileHandler:
+    """Get or create the shared rotating handler for a log file."""
+    handler = _FILE_HANDLERS.get(file_path)
+    if handler is None:
+        handler = RotatingFileHandler(
+            file_path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        _FILE_HANDLERS[file_path] = handler
+    return handler
+
 
 def setup_logger(
     name: str,
@@ -58,12 +84,7 @@ def setup_logger(
         LOG_DIR.mkdir(parents=True, exist_ok=True)
 
         file_path = LOG_DIR / log_file
-        file_handler = RotatingFileHandler(
-            file_path,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
-        )
+        file_handler = _get_file_handler(file_path, max_bytes, backup_count)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
@@ -87,6 +108,21 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Background listener draining the root logger's queue (see
+# configure_app_logging); stopped at interpreter exit to flush records
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 # Application-wide logger configuration
 def configure_app_logging(
     level: int = logging.INFO,
@@ -103,6 +139,8 @@ def configure_app_logging(
         log_to_file: Whether to enable file logging (default: True)
         log_file: Log file name (default: "openx.log")
     """
+    global _queue_listener
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -110,6 +148,8 @@ def configure_app_logging(
     # Remove existing handlers to avoid duplicates
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    if _queue_listener is not None:
+        _queue_listener.stop()
 
     # Create formatter
     formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
@@ -118,21 +158,30 @@ def configure_app_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (optional)
     if log_to_file:
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         file_path = LOG_DIR / log_file
-        file_handler = RotatingFileHandler(
+        file_handler = _get_file_handler(
             file_path,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding="utf-8",
+            max_bytes=10 * 1024 * 1024,  # 10MB
+            backup_count=5,
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # The real handlers do blocking I/O, so they drain a queue on a
+    # background thread; a log call on the event loop thread is just a
+    # queue put, never a write or a handler-lock wait
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
 
 
 # Example usage and module-level logger for this file
@@ -2,11 +2,16 @@
 Security middleware for OpenX application
 Handles CSRF protection, security headers, and cookie security
 """
+import hmac
+import logging
 import secrets
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logger import get_logger
+
+# Resolved once at import; logging.getLogger takes a lock and walks the
+# logger dict, which is wasted work per request
+_request_logger = get_logger("requests")
 
 
 # Security headers configuration
@@ -29,21 +34,52 @@ SECURITY_HEADERS = {
     ),
 }
 
+# Encoded once at import time; names are lowercase bytes per the ASGI spec.
+# Re-encoding per response is pure waste - the CSP value alone is ~200 bytes.
+_SECURITY_HEADERS_RAW = tuple(
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in SECURITY_HEADERS.items()
+)
+
+
+class SecurityHeadersMiddleware:
+    """
+    Add security headers to all responses.
+
+    Implemented as a raw ASGI middleware rather than BaseHTTPMiddleware:
+    the headers are appended directly to the http.response.start message,
+    avoiding the per-request task group and Request/Response construction
+    that BaseHTTPMiddleware adds on every response.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses"""
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.extend(_SECURITY_HEADERS_RAW)
+                message["headers"] = headers
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
 
-        # Add security headers
-        for header, value in SECURITY_HEADERS.items():
-            response.headers[header] = value
 
-        return response
+# CSRF constants at module scope: referencing globals from __call__ skips
+# the per-request MRO walk a class-attribute lookup costs
+_CSRF_HEADER = b"x-csrf-token"
+_CSRF_COOKIE = b"csrf_token"
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+class CSRFMiddleware:
     """
     CSRF protection middleware.
 
@@ -51,78 +87,140 @@ class CSRFMiddleware(BaseHTTPMiddleware):
     For POST/PUT/PATCH/DELETE requests: Validate the CSRF token
 
     API routes are exempt since they use X-Secret-Key header authentication.
-    """
-
-    CSRF_HEADER = "X-CSRF-Token"
-    CSRF_COOKIE = "csrf_token"
-    SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
 
-    def _is_api_route(self, path: str) -> bool:
-        """Check if the path is an API route (exempt from CSRF)."""
-        return path.startswith("/api/")
+    Implemented as a raw ASGI middleware: cookies and tokens are read
+    directly off scope["headers"] without building Request/Response
+    objects, and rejections are sent as pre-built ASGI messages.
+    """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate CSRF token for session
-        csrf_token = request.cookies.get(self.CSRF_COOKIE)
+    __slots__ = ("app",)
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @staticmethod
+    def _cookie_value(cookie_header: bytes | None, name: bytes) -> bytes | None:
+        """Extract one cookie value without full http.cookies parsing."""
+        if not cookie_header:
+            return None
+        prefix = name + b"="
+        for part in cookie_header.split(b";"):
+            part = part.strip()
+            if part.startswith(prefix):
+                return part[len(prefix):]
+        return None
+
+    async def _reject(self, send: Send, body: bytes) -> None:
+        """Send a pre-built 403 JSON response."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 403,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Collect the cookie and CSRF headers in one pass over scope["headers"]
+        cookie_header = None
+        header_token = None
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                cookie_header = value
+            elif name == _CSRF_HEADER:
+                header_token = value
+
+        # For safe methods, just proceed; set the CSRF cookie if not present.
+        # API routes never consume the cookie (they authenticate via the
+        # X-Secret-Key header), so skip the token generation for them too -
+        # token_urlsafe costs a getrandom syscall per call.
+        if scope["method"] in _SAFE_METHODS:
+            if (
+                self._cookie_value(cookie_header, _CSRF_COOKIE) is not None
+                or scope["path"].startswith("/api/")
+            ):
+                await self.app(scope, receive, send)
+                return
 
-        if not csrf_token:
             csrf_token = secrets.token_urlsafe(32)
-
-        # For safe methods, just proceed
-        if request.method in self.SAFE_METHODS:
-            response = await call_next(request)
-            # Set CSRF cookie if not present
-            if not request.cookies.get(self.CSRF_COOKIE):
-                response.set_cookie(
-                    key=self.CSRF_COOKIE,
-                    value=csrf_token,
-                    httponly=False,  # Must be accessible to JS
-                    secure=False,  # Set True in production with HTTPS
-                    samesite="strict",
-                    max_age=60 * 60 * 24 * 365,  # 1 year
-                )
-            return response
+            set_cookie = (
+                f"csrf_token={csrf_token}; Max-Age={60 * 60 * 24 * 365}; "
+                "Path=/; SameSite=strict"
+            ).encode("latin-1")
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    # Not HttpOnly: must be accessible to JS. Add Secure in
+                    # production with HTTPS.
+                    headers.append((b"set-cookie", set_cookie))
+                    message["headers"] = headers
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+            return
 
         # For unsafe methods, validate CSRF token
         # API routes are exempt (they use X-Secret-Key header auth)
-        if self._is_api_route(request.url.path):
-            return await call_next(request)
+        if scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
 
-        # Check for CSRF token in header
-        header_token = request.headers.get(self.CSRF_HEADER)
-        cookie_token = request.cookies.get(self.CSRF_COOKIE)
+        cookie_token = self._cookie_value(cookie_header, _CSRF_COOKIE)
 
         if not header_token or not cookie_token:
-            return JSONResponse(
-                {"detail": "CSRF token missing"},
-                status_code=403,
-            )
+            await self._reject(send, b'{"detail":"CSRF token missing"}')
+            return
 
-        if not secrets.compare_digest(header_token, cookie_token):
-            return JSONResponse(
-                {"detail": "Invalid CSRF token"},
-                status_code=403,
-            )
+        # Tokens are urlsafe ASCII, so the raw bytes compare identically -
+        # constant-time, without the str decode/encode round-trip
+        if not hmac.compare_digest(header_token, cookie_token):
+            await self._reject(send, b'{"detail":"Invalid CSRF token"}')
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Log requests for audit purposes"""
+class RequestLoggingMiddleware:
+    """
+    Log requests for audit purposes.
+
+    Implemented as a raw ASGI middleware: method, path and client are
+    read straight from the scope, and %-style formatting defers string
+    work to the logging handler, so filtered records cost nothing.
+    """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Import logger here to avoid circular imports
-        from src.core.logger import get_logger
+    __slots__ = ("app",)
 
-        logger = get_logger("requests")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Log the request
-        client_ip = request.client.host if request.client else "unknown"
-        logger.info(f"{request.method} {request.url.path} - IP: {client_ip}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        method = scope["method"]
+        path = scope["path"]
 
-        # Log the response status
-        logger.info(f"{request.method} {request.url.path} - Status: {response.status_code}")
+        if _request_logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+            _request_logger.info("%s %s - IP: %s", method, path, client_ip)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                _request_logger.info(
+                    "%s %s - Status: %s", method, path, message["status"]
+                )
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
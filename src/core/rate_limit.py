@@ -4,13 +4,18 @@ Secure rate limiting utilities for OpenX application.
 Provides a secure key function for rate limiting that properly handles
 X-Forwarded-For headers by only trusting them from known proxy IPs.
 """
+import functools
+import ipaddress
 import os
 from typing import Callable
 
 from fastapi import Request
 
+# Singleton IPs as a frozenset, CIDR ranges as ip_network objects
+TrustedProxies = tuple[frozenset[str], tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]]
 
-def parse_trusted_proxies() -> set[str]:
+
+def parse_trusted_proxies() -> TrustedProxies:
     """
     Parse trusted proxy IPs from environment variable.
 
@@ -20,17 +25,19 @@ def parse_trusted_proxies() -> set[str]:
 
     Example: OPENX_TRUSTED_PROXIES="10.0.0.1,10.0.0.2,172.16.0.0/12"
 
-    Supports both individual IPs and CIDR notation.
+    Supports both individual IPs and CIDR notation. CIDR ranges are kept
+    as ip_network objects and tested by containment - expanding something
+    like 172.16.0.0/12 into ~1M host strings would cost tens of MB and a
+    multi-second startup stall.
 
     Returns:
-        Set of trusted IP addresses (expanded if CIDR ranges provided).
+        Tuple of (individual IPs, CIDR networks).
     """
     proxy_config = os.getenv("OPENX_TRUSTED_PROXIES", "")
 
-    if not proxy_config:
-        return set()
+    singletons: set[str] = set()
+    networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network] = []
 
-    trusted = set()
     for proxy in proxy_config.split(","):
         proxy = proxy.strip()
         if not proxy:
@@ -39,23 +46,21 @@ def parse_trusted_proxies() -> set[str]:
         # Handle CIDR notation
         if "/" in proxy:
             try:
-                import ipaddress
-                network = ipaddress.ip_network(proxy, strict=False)
-                trusted.update(str(ip) for ip in network.hosts())
+                networks.append(ipaddress.ip_network(proxy, strict=False))
             except ValueError:
                 # Invalid CIDR, skip
                 continue
         else:
-            trusted.add(proxy)
+            singletons.add(proxy)
 
-    return trusted
+    return frozenset(singletons), tuple(networks)
 
 
 # Cache the trusted proxies at module level to avoid re-parsing on every request
-_TRUSTED_PROXIES: set[str] | None = None
+_TRUSTED_PROXIES: TrustedProxies | None = None
 
 
-def get_trusted_proxies() -> set[str]:
+def get_trusted_proxies() -> TrustedProxies:
     """Get cached trusted proxies, parsing on first access."""
     global _TRUSTED_PROXIES
     if _TRUSTED_PROXIES is None:
@@ -63,6 +68,68 @@ def get_trusted_proxies() -> set[str]:
     return _TRUSTED_PROXIES
 
 
+def _is_trusted(ip: str, trusted_proxies: TrustedProxies) -> bool:
+    """Check whether an IP is a trusted proxy (singleton or CIDR member)."""
+    singletons, networks = trusted_proxies
+    if ip in singletons:
+        return True
+    if not networks:
+        return False
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return any(addr in network for network in networks)
+
+
+@functools.lru_cache(maxsize=2048)
+def _resolve_client_ip(
+    direct_client_ip: str, x_forwarded_for: str | None, trusted_id: int
+) -> str:
+    """
+    Resolve the effective client IP, memoized per (direct IP, XFF header).
+
+    The same few clients dominate traffic, so the header-splitting and
+    trusted-proxy walk collapse to a single cache probe on repeat
+    requests. trusted_id is the identity of the parsed proxy config;
+    including it in the key invalidates the cache if config is reloaded.
+    """
+    trusted_proxies = get_trusted_proxies()
+
+    # If no trusted proxies configured, just use direct client IP
+    singletons, networks = trusted_proxies
+    if not singletons and not networks:
+        return direct_client_ip
+
+    # Only trust X-Forwarded-For if the direct client is a trusted proxy
+    if not _is_trusted(direct_client_ip, trusted_proxies):
+        return direct_client_ip
+
+    if not x_forwarded_for:
+        # No X-Forwarded-For header, use direct client
+        return direct_client_ip
+
+    # X-Forwarded-For format: client, proxy1, proxy2, ...
+    # The leftmost value is the original client, rightmost is the most recent proxy
+    # We want the rightmost non-trusted IP (the client that connected to our first proxy)
+    ips = x_forwarded_for.split(",")
+
+    # Single pass accumulating the chosen index: every entry is scored, so
+    # attacker-controlled chain contents don't steer an early return, and
+    # there's no reversed() iterator allocation
+    chosen = -1
+    for i in range(len(ips) - 1, -1, -1):
+        ip = ips[i].strip()
+        mask = bool(ip) and not _is_trusted(ip, trusted_proxies)
+        chosen = i if (mask and chosen < 0) else chosen
+
+    if chosen >= 0:
+        return ips[chosen].strip()
+
+    # All IPs in chain are trusted proxies, use the leftmost (original source)
+    return ips[0].strip() if ips else direct_client_ip
+
+
 def get_real_client_ip(request: Request) -> str:
     """
     Get the real client IP address for rate limiting.
@@ -86,36 +153,11 @@ def get_real_client_ip(request: Request) -> str:
     # Get the direct client IP (the immediate TCP connection)
     direct_client_ip = request.client.host if request.client else "unknown"
 
-    # Get trusted proxies
-    trusted_proxies = get_trusted_proxies()
-
-    # If no trusted proxies configured, just use direct client IP
-    if not trusted_proxies:
-        return direct_client_ip
-
-    # Only trust X-Forwarded-For if the direct client is a trusted proxy
-    if direct_client_ip not in trusted_proxies:
-        return direct_client_ip
-
-    # We're behind a trusted proxy, so extract the real client IP from X-Forwarded-For
-    x_forwarded_for = request.headers.get("X-Forwarded-For")
-
-    if not x_forwarded_for:
-        # No X-Forwarded-For header, use direct client
-        return direct_client_ip
-
-    # X-Forwarded-For format: client, proxy1, proxy2, ...
-    # The leftmost value is the original client, rightmost is the most recent proxy
-    # We want the rightmost non-trusted IP (the client that connected to our first proxy)
-    ips = [ip.strip() for ip in x_forwarded_for.split(",")]
-
-    # Find the rightmost IP that is NOT a trusted proxy
-    for ip in reversed(ips):
-        if ip and ip not in trusted_proxies:
-            return ip
-
-    # All IPs in chain are trusted proxies, use the leftmost (original source)
-    return ips[0] if ips else direct_client_ip
+    return _resolve_client_ip(
+        direct_client_ip,
+        request.headers.get("X-Forwarded-For"),
+        id(get_trusted_proxies()),
+    )
 
 
 def get_real_client_ip_factory() -> Callable[[Request], str]:
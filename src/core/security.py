@@ -1,6 +1,7 @@
 import os
 import hmac
 import hashlib
+import threading
 import bcrypt
 
 
@@ -24,16 +25,20 @@ def new_branch_master_key() -> str:
     return f"bmk-{newkey(32)}"
 
 
+# Bcrypt cost factor. Exponential: each extra round doubles the work.
+# Tunable via env so tests can use a cheap setting; production default is 12.
+BCRYPT_ROUNDS = int(os.getenv("OPENX_BCRYPT_ROUNDS", "12"))
+
+
 def _prepare_key_for_bcrypt(key: str) -> bytes:
     """
     Prepare a key for bcrypt hashing.
-    Bcrypt has a 72 byte limit, so we hash longer keys with SHA256 first.
+
+    Always pre-hashes with SHA256: the 64-char hex digest is under
+    bcrypt's 72 byte limit, and the fixed-length input removes the
+    length-dependent branch from the hot path.
     """
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) > 72:
-        # Hash with SHA256 for longer keys
-        return hashlib.sha256(key_bytes).hexdigest().encode('utf-8')
-    return key_bytes
+    return hashlib.sha256(key.encode('utf-8')).hexdigest().encode('ascii')
 
 
 def hash_key(key: str) -> str:
@@ -46,7 +51,7 @@ def hash_key(key: str) -> str:
     Returns:
         The bcrypt hash as a string
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     key_bytes = _prepare_key_for_bcrypt(key)
     hashed = bcrypt.hashpw(key_bytes, salt)
     return hashed.decode('utf-8')
@@ -70,6 +75,54 @@ def verify_key(plain_key: str, hashed_key: str) -> bool:
         return False
 
 
+# Ephemeral per-process pepper for the verification cache. Cache keys are
+# HMACs of the plain key under this pepper, never the key itself, and the
+# cache empties on every restart.
+_PEPPER = os.urandom(32)
+
+_VERIFY_CACHE_MAXSIZE = 4096
+
+# (sk_id, mac, hashed_key) -> verification result
+_verify_cache: dict[tuple[str, bytes, str], bool] = {}
+_verify_lock = threading.RLock()
+
+
+def verify_key_for_id(sk_id: str, plain_key: str, hashed_key: str) -> bool:
+    """
+    Verify a key against its bcrypt hash, caching the result per key id.
+
+    bcrypt is deliberately slow (~hundreds of ms at rounds=12), but a
+    long-lived session key is re-verified on every request. The result is
+    cached under an HMAC of the plain key with a per-process random pepper,
+    so repeat verifications cost one SHA256 instead of a bcrypt run and the
+    cache never stores plaintext keys.
+
+    Args:
+        sk_id: Key identifier the hash was looked up by
+        plain_key: The plain text key to verify
+        hashed_key: The bcrypt hash to compare against
+
+    Returns:
+        True if the key matches, False otherwise
+    """
+    mac = hmac.new(_PEPPER, plain_key.encode('utf-8'), "sha256").digest()
+    cache_key = (sk_id, mac, hashed_key)
+
+    with _verify_lock:
+        cached = _verify_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = verify_key(plain_key, hashed_key)
+
+    with _verify_lock:
+        if len(_verify_cache) >= _VERIFY_CACHE_MAXSIZE:
+            _verify_cache.clear()
+        _verify_cache[cache_key] = result
+
+    return result
+
+
 def constant_time_compare(a: str, b: str) -> bool:
     """
     Perform a constant-time string comparison to prevent timing attacks.
@@ -84,29 +137,38 @@ def constant_time_compare(a: str, b: str) -> bool:
     return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
 
 
-# Legacy aliases for backward compatibility
+# Server-side pepper for branch master key hashes. Must be set (and kept
+# stable) in production; the dev default keeps local runs and tests working.
+_MASTER_PEPPER = os.getenv("OPENX_MASTER_PEPPER", "openx-dev-master-pepper").encode('utf-8')
+
+
 def hash_master_key(master_key: str) -> str:
     """
-    Hash a branch master key using bcrypt.
-    
+    Hash a branch master key using peppered HMAC-SHA256.
+
+    Master keys are 32-byte urandom tokens, so they already carry full
+    entropy - brute force from a dumped hash is infeasible and bcrypt's
+    slowdown buys nothing on the moderation hot path. User secret keys
+    stay on bcrypt (see hash_key).
+
     Args:
         master_key: The plain text master key to hash
-        
+
     Returns:
-        The bcrypt hash as a string
+        The HMAC-SHA256 hex digest as a string
     """
-    return hash_key(master_key)
+    return hmac.new(_MASTER_PEPPER, master_key.encode('utf-8'), "sha256").hexdigest()
 
 
 def verify_master_key(master_key: str, hashed_key: str) -> bool:
     """
-    Verify a master key against its bcrypt hash.
-    
+    Verify a master key against its peppered HMAC-SHA256 hash.
+
     Args:
         master_key: The plain text master key to verify
-        hashed_key: The bcrypt hash to compare against
-        
+        hashed_key: The HMAC-SHA256 hex digest to compare against
+
     Returns:
         True if the key matches, False otherwise
     """
-    return verify_key(master_key, hashed_key)
\ No newline at end of file
+    return hmac.compare_digest(hash_master_key(master_key), hashed_key)
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+In-memory cache for static file responses.
+
+The stock StaticFiles mount re-stats and re-opens every asset on every
+request. The static tree is tiny (css/js), so the file bytes and a
+content-derived ETag are cached in memory and conditional requests are
+answered with 304 Not Modified without touching the filesystem.
+
+Cached entries are lazily revalidated against the file's mtime at most
+once per CHECK_INTERVAL, so edits on disk still show up.
+"""
+import hashlib
+import mimetypes
+import os
+import stat
+import time
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# How often (seconds) to re-stat a cached file for changes
+CHECK_INTERVAL = 60
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class _CacheEntry:
+    __slots__ = ("content", "etag", "media_type", "mtime", "checked_at")
+
+    def __init__(
+        self, content: bytes, etag: str, media_type: str | None, mtime: float
+    ):
+        self.content = content
+        self.etag = etag
+        self.media_type = media_type
+        self.mtime = mtime
+        self.checked_at = time.monotonic()
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that serves small assets from memory with strong ETags."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cache: dict[str, _CacheEntry] = {}
+
+    def _load(self, path: str) -> _CacheEntry | None:
+        """Read a file into the cache, or return None if it can't be served."""
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        with open(full_path, "rb") as f:
+            content = f.read()
+
+        etag = hashlib.blake2b(content).hexdigest()[:16]
+        media_type = mimetypes.guess_type(full_path)[0]
+        entry = _CacheEntry(content, etag, media_type, stat_result.st_mtime)
+        self._cache[path] = entry
+        return entry
+
+    def _get_entry(self, path: str) -> _CacheEntry | None:
+        entry = self._cache.get(path)
+        if entry is None:
+            return self._load(path)
+
+        # Revalidate against the filesystem at most once per interval
+        if time.monotonic() - entry.checked_at > CHECK_INTERVAL:
+            full_path, stat_result = self.lookup_path(path)
+            if stat_result is None or stat_result.st_mtime != entry.mtime:
+                self._cache.pop(path, None)
+                return self._load(path)
+            entry.checked_at = time.monotonic()
+
+        return entry
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            # Keep StaticFiles' method guard: anything else is a 405
+            return await super().get_response(path, scope)
+
+        entry = self._get_entry(path)
+        if entry is None:
+            # Missing files, directories etc. — let StaticFiles handle it
+            return await super().get_response(path, scope)
+
+        headers = {"ETag": f'"{entry.etag}"', "Cache-Control": CACHE_CONTROL}
+
+        if_none_match = Headers(scope=scope).get("If-None-Match")
+        if if_none_match is not None and entry.etag in if_none_match:
+            return Response(status_code=304, headers=headers)
+
+        if scope["method"] == "HEAD":
+            # Empty body, but the headers must describe the real entity
+            # (RFC 9110 §9.3.2); Response won't override an explicit length
+            headers["Content-Length"] = str(len(entry.content))
+            if entry.media_type is not None:
+                headers["Content-Type"] = entry.media_type
+            return Response(b"", headers=headers)
+
+        return Response(entry.content, media_type=entry.media_type, headers=headers)
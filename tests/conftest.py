@@ -2,10 +2,28 @@
 Test configuration and fixtures for OpenX tests.
 """
 
+import os
+import sys
+
+# Cheapest bcrypt cost for the suite; must be set before src.core.security
+# is imported (the rounds are read at import time). Hashing semantics are
+# unchanged, each hash just drops from ~250ms to ~1ms.
+os.environ.setdefault("OPENX_BCRYPT_ROUNDS", "4")
+
+# Aggregate bytecode compiled during test runs in one place, so xdist
+# workers reuse cached .pyc files instead of scattering __pycache__ dirs
+sys.pycache_prefix = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ".pytest_cache",
+    "pyc",
+)
+
 import pytest
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, select
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, event, insert, select
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -17,33 +35,180 @@ from src.core.db.tables.recoverykey import RecoveryKey
 from src.core.db.tables.secretkey import SecretKey
 from src.core.db.tables.secretkey import SecretKey as SKModel
 from src.core.db.tables.userpost import ImagePost, TextPost, UserPost, VideoPost
-from src.core.security import hash_key, new_rk, new_sk, verify_key
+from src.core.security import hash_key, new_rk, new_sk, verify_key_for_id
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create an isolated test database session for each test."""
+@pytest.fixture(scope="session")
+def _test_engine(_test_user_keys, _test_branch_keys):
+    """
+    One in-memory engine with the schema created once for the whole run.
+
+    The shared test user and branch rows are committed here as base state,
+    before any test checks out the StaticPool's single connection; each
+    test's mutations happen inside a rolled-back transaction on top.
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; take over
+    # BEGIN emission so the savepoint-rollback isolation below works
+    @event.listens_for(engine, "connect")
+    def _do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
 
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    with Session(engine) as session:
+        session.add(
+            SecretKey(
+                sk_id=_test_user_keys["sk"][:16],
+                sk_hash=_test_user_keys["sk_hash"],
+                username="testuser",
+            )
+        )
+        session.add(
+            RecoveryKey(
+                rk_id=_test_user_keys["rk"][:16],
+                rk_hash=_test_user_keys["rk_hash"],
+                username="testuser",
+            )
+        )
+        session.add(
+            Branch(
+                name="testbranch",
+                description="A test branch",
+                master_key=_test_branch_keys["master_key_hash"],
+                created_by="testuser",
+            )
+        )
+        session.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(_test_engine):
+    """
+    Create an isolated test database session for each test.
+
+    Each test runs inside an outer transaction on a shared engine; commits
+    inside the test become savepoints and the whole transaction is rolled
+    back afterwards, so isolation holds without re-running DDL per test.
+    """
+    connection = _test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
     session.close()
-    Base.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _single_app_instance():
+    """
+    Guard that every test exercises the one module-level app instance.
+
+    Pydantic v2 compiles a SchemaValidator per model when the app module
+    is imported; as long as src.app is imported exactly once, that
+    compilation cost is paid once for the whole session.
+    """
+    from src.app import app as app_before
+
+    yield
+
+    from src.app import app as app_after
+
+    assert app_before is app_after, "src.app was re-imported mid-session"
+
+
+@pytest.fixture(scope="session")
+def _shared_test_client():
+    """
+    One TestClient for the whole session.
+
+    TestClient construction spins up an httpx client and ASGI transport;
+    sharing one instance and swapping dependency overrides per test
+    amortizes that cost across the run. The client is deliberately not
+    entered as a context manager: the app lifespan runs init_schema()
+    against the production database file, which tests must not touch -
+    every test supplies its own engine via the get_db override instead.
+    """
+    from src.app import app
+
+    client = TestClient(app)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def seed_posts(db_session):
+    """
+    Bulk-insert text posts directly through the ORM.
+
+    Seeding through the HTTP layer pays routing, validation, and a
+    commit per post; tests that only need existing rows insert them in
+    one batch and keep the HTTP round-trip for the behavior under test.
+    Returns the inserted post ids.
+    """
+
+    def _seed(username, contents, branch=None):
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "type": "text",
+                "username": username,
+                "branch": branch,
+                "content": content,
+                "created_at": now,
+            }
+            for content in contents
+        ]
+        ids = db_session.scalars(
+            insert(UserPost).returning(UserPost.id), rows
+        ).all()
+        db_session.flush()
+        return ids
+
+    return _seed
+
+
+@pytest.fixture(scope="module")
+def cached_get(_shared_test_client):
+    """
+    Memoized GET against the shared client for idempotent pages.
+
+    Pure pages (no auth, no mutation) render identically on every
+    request, so repeat assertions across a module reuse one response
+    instead of re-rendering the template or re-reading the static file.
+    """
+    cache: dict[str, object] = {}
+
+    def _get(url: str):
+        response = cache.get(url)
+        if response is None:
+            response = cache[url] = _shared_test_client.get(url)
+        return response
+
+    return _get
 
 
 @pytest.fixture
-def client_factory():
+def client_factory(_shared_test_client):
     """Factory to create test clients with a specific db session."""
 
-    def create_client(session, user_sk=None):
+    def create_client(session=None, user_sk=None):
         from fastapi import HTTPException, Request, status
         from sqlalchemy import select
 
@@ -51,8 +216,14 @@ def client_factory():
         from src.core.db.session import get_db
 
         def override_get_db():
+            # Tests for pages that never execute a query can omit the
+            # session and skip the savepoint fixture entirely
             yield session
 
+        # Memoized per client: repeat requests with the same cookie skip the
+        # SecretKey select and bcrypt verify after the first resolution
+        sk_cache: dict[str, SKModel] = {}
+
         def override_get_current_user(
             request: Request, session: Session = Depends(get_db)
         ):
@@ -67,6 +238,10 @@ def client_factory():
                     status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
                 )
 
+            cached = sk_cache.get(secret_key)
+            if cached is not None:
+                return cached
+
             sk_id = secret_key[:16] if len(secret_key) >= 16 else secret_key
             sk_object = session.execute(
                 select(SKModel).where(SKModel.sk_id == sk_id)
@@ -78,74 +253,77 @@ def client_factory():
                     detail="Invalid secret key",
                 )
 
-            if not verify_key(secret_key, sk_object.sk_hash):
+            if not verify_key_for_id(sk_id, secret_key, sk_object.sk_hash):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid secret key",
                 )
 
+            sk_cache[secret_key] = sk_object
             return sk_object
 
         app.dependency_overrides[get_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
-        client = TestClient(app)
+        client = _shared_test_client
         if user_sk:
             # Set cookie for authentication
             client.cookies.set("secret_key", user_sk)
+
+            # Frontend pages resolve the user via get_current_user_optional;
+            # inject it directly so page tests skip the lookup-and-verify path
+            from src.app import get_current_user_optional
+
+            sk_id = user_sk[:16] if len(user_sk) >= 16 else user_sk
+            username = session.execute(
+                select(SKModel.username).where(SKModel.sk_id == sk_id)
+            ).scalar()
+            if username is not None:
+                user = {"username": username, "sk": user_sk}
+                app.dependency_overrides[get_current_user_optional] = lambda: user
         return client
 
     yield create_client
 
     # Cleanup
     from src.app import app
+    from src.core import auth_cache
 
     app.dependency_overrides.clear()
+    auth_cache.clear()
+    _shared_test_client.cookies.clear()
 
 
-@pytest.fixture
-def test_user_data(db_session):
-    """Create a test user and return their credentials."""
+@pytest.fixture(scope="session")
+def _test_user_keys():
+    """Generate and hash the test user's keys once for the whole run."""
     sk = new_sk()
     rk = new_rk()
+    return {"sk": sk, "rk": rk, "sk_hash": hash_key(sk), "rk_hash": hash_key(rk)}
 
-    sk_id = sk[:16]
-    rk_id = rk[:16]
-
-    sk_hash = hash_key(sk)
-    rk_hash = hash_key(rk)
-
-    secret_key = SecretKey(sk_id=sk_id, sk_hash=sk_hash, username="testuser")
-    recovery_key = RecoveryKey(rk_id=rk_id, rk_hash=rk_hash, username="testuser")
 
-    db_session.add(secret_key)
-    db_session.add(recovery_key)
-    db_session.commit()
-
-    return {"username": "testuser", "sk": sk, "rk": rk}
+@pytest.fixture
+def test_user_data(db_session, _test_user_keys):
+    """Credentials for the shared test user seeded at engine setup."""
+    keys = _test_user_keys
+    return {"username": "testuser", "sk": keys["sk"], "rk": keys["rk"]}
 
 
-@pytest.fixture
-def test_branch_data(db_session, test_user_data):
-    """Create a test branch."""
+@pytest.fixture(scope="session")
+def _test_branch_keys():
+    """Generate and hash the test branch master key once for the whole run."""
     from src.core.security import hash_master_key, new_branch_master_key
 
     master_key = new_branch_master_key()
-    hashed_key = hash_master_key(master_key)
-
-    branch = Branch(
-        name="testbranch",
-        description="A test branch",
-        master_key=hashed_key,
-        created_by=test_user_data["username"],
-    )
+    return {"master_key": master_key, "master_key_hash": hash_master_key(master_key)}
 
-    db_session.add(branch)
-    db_session.commit()
 
+@pytest.fixture
+def test_branch_data(db_session, test_user_data, _test_branch_keys):
+    """Data for the shared test branch seeded at engine setup."""
     return {
         "name": "testbranch",
         "description": "A test branch",
-        "master_key": master_key,
+        "master_key": _test_branch_keys["master_key"],
         "created_by": test_user_data["username"],
     }
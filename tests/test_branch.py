@@ -76,97 +76,69 @@ class TestBranchRetrieval:
         # Master key should not be exposed
         assert "master_key" not in data
 
-    def test_get_nonexistent_branch(self, db_session, client_factory):
-        """Test getting a non-existent branch."""
-        client = client_factory(db_session)
-        response = client.get("/api/branch/nonexistent")
-
-        assert response.status_code == 404
-
 
 class TestBranchPosts:
     """Tests for branch posts."""
 
-    def test_create_text_post(
-        self, db_session, client_factory, test_user_data, test_branch_data
+    @pytest.mark.parametrize(
+        "payload,checks",
+        [
+            (
+                {"type": "text", "content": "Hello, world!"},
+                {"type": "text", "content": "Hello, world!"},
+            ),
+            (
+                {
+                    "type": "image",
+                    "content": "Check out this image",
+                    "image_url": "http://example.com/image.png",
+                },
+                {"type": "image", "image_url": "http://example.com/image.png"},
+            ),
+            (
+                {
+                    "type": "video",
+                    "content": "Check out this video",
+                    "video_url": "http://example.com/video.mp4",
+                    "duration_seconds": 120,
+                },
+                {
+                    "type": "video",
+                    "video_url": "http://example.com/video.mp4",
+                    "duration_seconds": 120,
+                },
+            ),
+        ],
+        ids=["text", "image", "video"],
+    )
+    def test_create_post(
+        self, db_session, client_factory, test_user_data, test_branch_data,
+        payload, checks,
     ):
-        """Test creating a text post in a branch."""
+        """Test creating each post type in a branch."""
         client = client_factory(db_session)
         response = client.post(
             f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "text",
-                "content": "Hello, world!",
-                "to_branch": test_branch_data["name"],
-            },
+            json={**payload, "to_branch": test_branch_data["name"]},
             headers={"X-Secret-Key": test_user_data["sk"]},
         )
 
         assert response.status_code == 201
         data = response.json()
-        assert data["type"] == "text"
-        assert data["content"] == "Hello, world!"
         assert data["branch"] == test_branch_data["name"]
-
-    def test_create_image_post(
-        self, db_session, client_factory, test_user_data, test_branch_data
-    ):
-        """Test creating an image post in a branch."""
-        client = client_factory(db_session)
-        response = client.post(
-            f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "image",
-                "content": "Check out this image",
-                "image_url": "http://example.com/image.png",
-                "to_branch": test_branch_data["name"],
-            },
-            headers={"X-Secret-Key": test_user_data["sk"]},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["type"] == "image"
-        assert data["image_url"] == "http://example.com/image.png"
-
-    def test_create_video_post(
-        self, db_session, client_factory, test_user_data, test_branch_data
-    ):
-        """Test creating a video post in a branch."""
-        client = client_factory(db_session)
-        response = client.post(
-            f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "video",
-                "content": "Check out this video",
-                "video_url": "http://example.com/video.mp4",
-                "duration_seconds": 120,
-                "to_branch": test_branch_data["name"],
-            },
-            headers={"X-Secret-Key": test_user_data["sk"]},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["type"] == "video"
-        assert data["video_url"] == "http://example.com/video.mp4"
-        assert data["duration_seconds"] == 120
+        for key, value in checks.items():
+            assert data[key] == value
 
     def test_get_branch_posts(
-        self, db_session, client_factory, test_user_data, test_branch_data
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
     ):
         """Test getting posts from a branch."""
         client = client_factory(db_session)
 
-        # Create a post first
-        client.post(
-            f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "text",
-                "content": "Test post content",
-                "to_branch": test_branch_data["name"],
-            },
-            headers={"X-Secret-Key": test_user_data["sk"]},
+        seed_posts(
+            test_user_data["username"],
+            ["Test post content"],
+            branch=test_branch_data["name"],
         )
 
         response = client.get(f"/api/branch/{test_branch_data['name']}/posts")
@@ -174,25 +146,20 @@ class TestBranchPosts:
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
-        assert any(p["content"] == "Test post content" for p in data)
+        contents = {p["content"] for p in data}
+        assert "Test post content" in contents
 
     def test_delete_own_post(
-        self, db_session, client_factory, test_user_data, test_branch_data
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
     ):
         """Test deleting own post."""
         client = client_factory(db_session)
 
-        # Create a post to delete
-        response = client.post(
-            f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "text",
-                "content": "Post to delete",
-                "to_branch": test_branch_data["name"],
-            },
-            headers={"X-Secret-Key": test_user_data["sk"]},
+        [post_id] = seed_posts(
+            test_user_data["username"],
+            ["Post to delete"],
+            branch=test_branch_data["name"],
         )
-        post_id = response.json()["id"]
 
         # Delete the post
         delete_response = client.delete(
@@ -207,22 +174,16 @@ class TestBranchModeration:
     """Tests for branch moderation."""
 
     def test_moderate_delete_post(
-        self, db_session, client_factory, test_user_data, test_branch_data
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
     ):
         """Test moderator deleting any post."""
         client = client_factory(db_session)
 
-        # Create a post
-        response = client.post(
-            f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "text",
-                "content": "Post to moderate",
-                "to_branch": test_branch_data["name"],
-            },
-            headers={"X-Secret-Key": test_user_data["sk"]},
+        [post_id] = seed_posts(
+            test_user_data["username"],
+            ["Post to moderate"],
+            branch=test_branch_data["name"],
         )
-        post_id = response.json()["id"]
 
         # Delete as moderator
         response = client.delete(
@@ -233,22 +194,16 @@ class TestBranchModeration:
         assert response.status_code == 204
 
     def test_moderate_without_master_key(
-        self, db_session, client_factory, test_user_data, test_branch_data
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
     ):
         """Test that moderation requires master key."""
         client = client_factory(db_session)
 
-        # Create a post
-        response = client.post(
-            f"/api/branch/{test_branch_data['name']}/posts",
-            json={
-                "type": "text",
-                "content": "Post to moderate",
-                "to_branch": test_branch_data["name"],
-            },
-            headers={"X-Secret-Key": test_user_data["sk"]},
+        [post_id] = seed_posts(
+            test_user_data["username"],
+            ["Post to moderate"],
+            branch=test_branch_data["name"],
         )
-        post_id = response.json()["id"]
 
         # Try to delete with invalid master key
         response = client.delete(
@@ -0,0 +1,43 @@
+"""
+Tests for the SQLAlchemy declarative registry.
+
+Guards against duplicate model definitions (e.g. a second copy of a
+table module imported under a different path), which make the registry
+do redundant mapper configuration at import time and can break lookups.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def Base():
+    """The declarative base, with every table module imported."""
+    # Importing the engine pulls in every table module
+    import src.core.db.engine  # noqa: F401
+    from src.core.db.tables.base import Base
+
+    return Base
+
+
+class TestDeclarativeRegistry:
+    """Tests that each table is mapped exactly once."""
+
+    def test_one_root_mapper_per_table(self, Base):
+        """Each table must have exactly one non-inheriting mapper."""
+        root_mappers = [m for m in Base.registry.mappers if m.inherits is None]
+        mapped_tables = [m.local_table.name for m in root_mappers]
+
+        assert len(mapped_tables) == len(set(mapped_tables))
+
+    def test_all_metadata_tables_are_mapped(self, Base):
+        """Every table in Base.metadata belongs to a registered mapper."""
+        root_mappers = [m for m in Base.registry.mappers if m.inherits is None]
+        mapped_tables = {m.local_table.name for m in root_mappers}
+
+        assert mapped_tables == set(Base.metadata.tables.keys())
+
+    def test_no_duplicate_class_names(self, Base):
+        """No two mapped classes may share a name (duplicate module copies)."""
+        class_names = [m.class_.__name__ for m in Base.registry.mappers]
+
+        assert len(class_names) == len(set(class_names))
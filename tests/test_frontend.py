@@ -3,33 +3,72 @@ Tests for frontend pages.
 """
 import pytest
 
+# Read-only tests; under pytest-xdist --dist=loadgroup they stay on one
+# worker and share that worker's session-scoped fixtures
+pytestmark = pytest.mark.xdist_group("frontend_ro")
+
 
 class TestFrontendPages:
     """Tests for frontend HTML pages."""
 
-    def test_feed_page(self, db_session, client_factory):
+    def test_feed_page(self, db_session, client_factory, cached_get):
         """Test the main feed page."""
-        client = client_factory(db_session)
-        response = client.get("/")
+        client_factory(db_session)
+        response = cached_get("/")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
         assert "OpenX" in response.text
         assert "Feed" in response.text
 
-    def test_login_page(self, db_session, client_factory):
-        """Test the login page."""
+    def test_feed_pagination(
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
+    ):
+        """Test the ?before= keyset cursor returns only older posts."""
+        client = client_factory(db_session)
+        ids = seed_posts(
+            test_user_data["username"],
+            ["first post", "second post", "third post"],
+            branch=test_branch_data["name"],
+        )
+
+        response = client.get(f"/?before={ids[1]}")
+
+        assert response.status_code == 200
+        # Strictly below the cursor: the cursor post itself is excluded
+        assert "first post" in response.text
+        assert "second post" not in response.text
+        assert "third post" not in response.text
+
+    def test_feed_pagination_malformed_cursor(
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
+    ):
+        """A malformed cursor is ignored and the first page is served."""
         client = client_factory(db_session)
-        response = client.get("/login")
+        seed_posts(
+            test_user_data["username"],
+            ["visible post"],
+            branch=test_branch_data["name"],
+        )
+
+        response = client.get("/?before=junk")
+
+        assert response.status_code == 200
+        assert "visible post" in response.text
+
+    def test_login_page(self, client_factory, cached_get):
+        """Test the login page."""
+        client_factory()
+        response = cached_get("/login")
 
         assert response.status_code == 200
         assert "Login" in response.text
         assert "Secret Key" in response.text
 
-    def test_register_page(self, db_session, client_factory):
+    def test_register_page(self, client_factory, cached_get):
         """Test the registration page."""
-        client = client_factory(db_session)
-        response = client.get("/register")
+        client_factory()
+        response = cached_get("/register")
 
         assert response.status_code == 200
         assert "Create Account" in response.text
@@ -43,13 +82,6 @@ class TestFrontendPages:
         assert response.status_code == 200
         assert test_branch_data["name"] in response.text
 
-    def test_branch_page_not_found(self, db_session, client_factory):
-        """Test non-existent branch returns 404."""
-        client = client_factory(db_session)
-        response = client.get("/b/nonexistent")
-
-        assert response.status_code == 404
-
     def test_user_page(self, db_session, client_factory, test_user_data):
         """Test user profile page."""
         client = client_factory(db_session)
@@ -58,53 +90,75 @@ class TestFrontendPages:
         assert response.status_code == 200
         assert test_user_data["username"] in response.text
 
-    def test_submit_page_unauthenticated(self, db_session, client_factory):
+    def test_submit_page_unauthenticated(self, client_factory):
         """Test submit page redirects when not logged in."""
-        client = client_factory(db_session)
+        client = client_factory()
         response = client.get("/submit", follow_redirects=False)
 
         assert response.status_code in [302, 307]
 
     def test_submit_page_authenticated(self, db_session, client_factory, test_user_data):
         """Test submit page when logged in."""
-        client = client_factory(db_session)
-        client.cookies.set("secret_key", test_user_data["sk"])
+        client = client_factory(db_session, user_sk=test_user_data["sk"])
 
         response = client.get("/submit")
 
         assert response.status_code == 200
         assert "Create Post" in response.text
 
-    def test_create_branch_page_unauthenticated(self, db_session, client_factory):
+    def test_create_branch_page_unauthenticated(self, client_factory):
         """Test create branch page redirects when not logged in."""
-        client = client_factory(db_session)
+        client = client_factory()
         response = client.get("/create-branch", follow_redirects=False)
 
         assert response.status_code in [302, 307]
 
 
+class TestNotFound:
+    """Bogus URLs across the API, page, and static layers return 404."""
+
+    @pytest.mark.parametrize(
+        "url",
+        ["/api/branch/nonexistent", "/b/nonexistent", "/static/nonexistent.css"],
+    )
+    def test_404(self, db_session, client_factory, cached_get, url):
+        client_factory(db_session)
+        assert cached_get(url).status_code == 404
+
+
+@pytest.fixture
+def staticfiles_app():
+    """The StaticFiles instance behind the /static mount."""
+    from starlette.staticfiles import StaticFiles
+
+    from src.app import app
+
+    for route in app.routes:
+        if isinstance(getattr(route, "app", None), StaticFiles):
+            return route.app
+    raise AssertionError("no StaticFiles mount on the app")
+
+
 class TestStaticFiles:
     """Tests for static file serving."""
 
-    def test_css_file(self, db_session, client_factory):
-        """Test CSS file is served."""
-        client = client_factory(db_session)
-        response = client.get("/static/css/style.css")
+    def test_css_file(self, client_factory, cached_get):
+        """Test CSS file is served end-to-end with the right content type."""
+        client_factory()
+        response = cached_get("/static/css/style.css")
 
         assert response.status_code == 200
         assert "text/css" in response.headers["content-type"]
 
-    def test_js_file(self, db_session, client_factory):
-        """Test JavaScript file is served."""
-        client = client_factory(db_session)
-        response = client.get("/static/js/app.js")
+    def test_js_file(self, staticfiles_app):
+        """Test the JavaScript file resolves inside the mount."""
+        full_path, stat_result = staticfiles_app.lookup_path("js/app.js")
 
-        assert response.status_code == 200
-        assert "javascript" in response.headers["content-type"] or "text/plain" in response.headers["content-type"]
+        assert stat_result is not None
+        assert full_path.endswith("app.js")
 
-    def test_nonexistent_static_file(self, db_session, client_factory):
-        """Test non-existent static file returns 404."""
-        client = client_factory(db_session)
-        response = client.get("/static/nonexistent.css")
+    def test_nonexistent_static_file(self, staticfiles_app):
+        """Test a non-existent static path does not resolve."""
+        _, stat_result = staticfiles_app.lookup_path("nonexistent.css")
 
-        assert response.status_code == 404
+        assert stat_result is None
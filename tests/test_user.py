@@ -39,15 +39,13 @@ class TestUserPosts:
         data = response.json()
         assert data["branch"] == test_branch_data["name"]
 
-    def test_get_user_posts(self, db_session, client_factory, test_user_data):
+    def test_get_user_posts(
+        self, db_session, client_factory, test_user_data, seed_posts
+    ):
         """Test getting user's posts."""
         client = client_factory(db_session, user_sk=test_user_data["sk"])
 
-        # Create a post first
-        client.post(
-            "/api/user/posts/",
-            json={"type": "text", "content": "User's post", "to_branch": None},
-        )
+        seed_posts(test_user_data["username"], ["User's post"])
 
         # Get posts
         response = client.get(f"/api/user/{test_user_data['username']}/posts/")
@@ -55,28 +53,20 @@ class TestUserPosts:
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
-        assert any(p["content"] == "User's post" for p in data)
+        contents = {p["content"] for p in data}
+        assert "User's post" in contents
 
     def test_get_user_posts_exclude_branch(
-        self, db_session, client_factory, test_user_data, test_branch_data
+        self, db_session, client_factory, test_user_data, test_branch_data, seed_posts
     ):
         """Test that branch posts are excluded by default."""
         client = client_factory(db_session, user_sk=test_user_data["sk"])
 
-        # Create profile post
-        client.post(
-            "/api/user/posts/",
-            json={"type": "text", "content": "Profile post", "to_branch": None},
-        )
-
-        # Create branch post
-        client.post(
-            "/api/user/posts/",
-            json={
-                "type": "text",
-                "content": "Branch post",
-                "to_branch": test_branch_data["name"],
-            },
+        seed_posts(test_user_data["username"], ["Profile post"])
+        seed_posts(
+            test_user_data["username"],
+            ["Branch post"],
+            branch=test_branch_data["name"],
         )
 
         # Get profile posts only (default)
@@ -91,16 +81,13 @@ class TestUserPosts:
         for post in data:
             assert post["branch"] is None
 
-    def test_get_post_by_id(self, db_session, client_factory, test_user_data):
+    def test_get_post_by_id(
+        self, db_session, client_factory, test_user_data, seed_posts
+    ):
         """Test getting a single post by ID."""
         client = client_factory(db_session, user_sk=test_user_data["sk"])
 
-        # Create a post
-        create_response = client.post(
-            "/api/user/posts/",
-            json={"type": "text", "content": "Single post", "to_branch": None},
-        )
-        post_id = create_response.json()["id"]
+        [post_id] = seed_posts(test_user_data["username"], ["Single post"])
 
         # Get the post
         response = client.get(f"/api/user/posts/{post_id}/")
@@ -110,16 +97,13 @@ class TestUserPosts:
         assert data["id"] == post_id
         assert data["content"] == "Single post"
 
-    def test_delete_own_post(self, db_session, client_factory, test_user_data):
+    def test_delete_own_post(
+        self, db_session, client_factory, test_user_data, seed_posts
+    ):
         """Test deleting own post."""
         client = client_factory(db_session, user_sk=test_user_data["sk"])
 
-        # Create a post
-        create_response = client.post(
-            "/api/user/posts/",
-            json={"type": "text", "content": "To delete", "to_branch": None},
-        )
-        post_id = create_response.json()["id"]
+        [post_id] = seed_posts(test_user_data["username"], ["To delete"])
 
         # Delete the post
         delete_response = client.delete(f"/api/user/posts/{post_id}/")
@@ -130,16 +114,13 @@ class TestUserPosts:
         get_response = client.get(f"/api/user/posts/{post_id}/")
         assert get_response.status_code == 404
 
-    def test_update_post(self, db_session, client_factory, test_user_data):
+    def test_update_post(
+        self, db_session, client_factory, test_user_data, seed_posts
+    ):
         """Test updating a post."""
         client = client_factory(db_session, user_sk=test_user_data["sk"])
 
-        # Create a post
-        create_response = client.post(
-            "/api/user/posts/",
-            json={"type": "text", "content": "Original content", "to_branch": None},
-        )
-        post_id = create_response.json()["id"]
+        [post_id] = seed_posts(test_user_data["username"], ["Original content"])
 
         # Update the post
         update_response = client.patch(